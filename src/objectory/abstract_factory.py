@@ -5,9 +5,10 @@ from __future__ import annotations
 
 __all__ = ["AbstractFactory", "is_abstract_factory", "register", "register_child_classes"]
 
-import inspect
 import logging
 from abc import ABCMeta
+from itertools import chain
+from types import FunctionType
 from typing import TYPE_CHECKING, Any
 
 from objectory.errors import (
@@ -23,6 +24,7 @@ from objectory.utils import (
     is_lambda_function,
     resolve_name,
 )
+from objectory.utils.object_helpers import _MISSING, _is_abstract
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -182,7 +184,7 @@ class AbstractFactory(ABCMeta):  # noqa: B024
             cls._abstractfactory_is_name_registered(name)
             and cls._abstractfactory_inheritors[name] != obj
         ):
-            logger.warning(f"The class {name} already exists. The new class replaces the old one")
+            logger.warning("The class %s already exists. The new class replaces the old one", name)
 
         cls._abstractfactory_inheritors[name] = obj
 
@@ -214,12 +216,14 @@ class AbstractFactory(ABCMeta):  # noqa: B024
         ```
         """
         resolved_name = cls._abstractfactory_resolve_name(name)
-        if resolved_name is None or not cls._abstractfactory_is_name_registered(resolved_name):
+        if (
+            resolved_name is None
+            or cls._abstractfactory_inheritors.pop(resolved_name, _MISSING) is _MISSING
+        ):
             msg = (
                 f"It is not possible to remove an object which is not registered (received: {name})"
             )
             raise UnregisteredObjectFactoryError(msg)
-        cls._abstractfactory_inheritors.pop(resolved_name)
 
     def _abstractfactory_get_target_from_name(cls, name: str) -> type | Callable:
         """Get the class or function to used given its name.
@@ -234,6 +238,8 @@ class AbstractFactory(ABCMeta):  # noqa: B024
             UnregisteredObjectFactoryError: if it is not possible
                 to find the target.
         """
+        if (target := cls._abstractfactory_inheritors.get(name)) is not None:
+            return target
         resolved_name = cls._abstractfactory_resolve_name(name)
         if resolved_name is None:
             msg = (
@@ -264,7 +270,7 @@ class AbstractFactory(ABCMeta):  # noqa: B024
             It returns the name to use to get the object if the
                 resolution was successful, otherwise ``None``.
         """
-        return resolve_name(name, set(cls._abstractfactory_inheritors.keys()))
+        return resolve_name(name, cls._abstractfactory_inheritors.keys())
 
     def _abstractfactory_is_name_registered(cls, name: str) -> bool:
         r"""Indicate if the name exists or not in the factory .
@@ -291,10 +297,10 @@ class AbstractFactory(ABCMeta):  # noqa: B024
             IncorrectObjectFactoryError: if it is an invalid
                 object for this factory.
         """
-        if not (inspect.isclass(obj) or inspect.isfunction(obj)):
+        if not isinstance(obj, (type, FunctionType)):
             msg = f"It is possible to register only a class or a function (received: {obj})"
             raise IncorrectObjectFactoryError(msg)
-        if is_lambda_function(obj):
+        if isinstance(obj, FunctionType) and is_lambda_function(obj):
             msg = (
                 "It is not possible to register a lambda function. "
                 "Please use a regular function instead"
@@ -377,10 +383,11 @@ def register_child_classes(
         )
         raise AbstractFactoryTypeError(msg)
 
-    for class_to_register in [cls] + list(all_child_classes(cls)):
-        if ignore_abstract_class and inspect.isabstract(class_to_register):
+    register_object = factory_cls.register_object
+    for class_to_register in chain((cls,), all_child_classes(cls)):
+        if ignore_abstract_class and _is_abstract(class_to_register):
             continue
-        factory_cls.register_object(class_to_register)
+        register_object(class_to_register)
 
 
 def is_abstract_factory(cls: Any) -> bool:
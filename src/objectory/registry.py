@@ -4,9 +4,10 @@ from __future__ import annotations
 
 __all__ = ["Registry"]
 
-import inspect
 import logging
-from typing import Any, Callable, TypeVar
+from itertools import chain
+from types import FunctionType
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from objectory.errors import (
     IncorrectObjectFactoryError,
@@ -22,6 +23,11 @@ from objectory.utils import (
     is_lambda_function,
     resolve_name,
 )
+from objectory.utils.name_resolution import _short_name
+from objectory.utils.object_helpers import _MISSING, _is_abstract
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -47,11 +53,28 @@ class Registry:
     ```
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_filters",
+        "_name_index",
+        "_registry_names",
+        "_resolve_cache",
+        "_state",
+    )
+
     _CLASS_FILTER = "class_filter"
 
     def __init__(self) -> None:
         self._state = {}
         self._filters = {}
+        # Names of the sub-registries stored in the state.
+        self._registry_names: set[str] = set()
+        # Index of the registered objects by short name i.e. the last
+        # part of the full name.
+        self._name_index: dict[str, set[str]] = {}
+        # Cache of the successful name resolutions. It has to be cleared
+        # every time an object is added or removed from the registry.
+        self._resolve_cache: dict[str, str] = {}
 
     def __getattr__(self, key: str) -> Registry | type:
         r"""Get the registry associated to a key.
@@ -63,6 +86,8 @@ class Registry:
             The registry associated to the key.
 
         Raises:
+            AttributeError: if the key is the name of a special
+                attribute e.g. ``__deepcopy__``.
             InvalidAttributeRegistryError: if the associated attribute
                 is not a registry.
 
@@ -75,8 +100,17 @@ class Registry:
 
         ```
         """
+        if (key.startswith("__") and key.endswith("__")) or key in self.__slots__:
+            # The special attributes are looked up by many tools (e.g.
+            # copy, pickle) so they should not create sub-registries.
+            # A slot reaches this method only if it is not initialized
+            # yet e.g. when copy or pickle creates the object before
+            # restoring its state.
+            msg = f"'{type(self).__qualname__}' object has no attribute '{key}'"
+            raise AttributeError(msg)
         if key not in self._state:
             self._state[key] = Registry()
+            self._registry_names.add(key)
         if self._is_registry(key):
             return self._state[key]
         msg = (
@@ -129,11 +163,11 @@ class Registry:
 
         ```
         """
-        if nested:  # If True, clear all the sub-registries.
-            for value in self._state.values():
-                if isinstance(value, Registry):
-                    value.clear(nested)
-        self._state.clear()
+        for registry in self._iter_registries() if nested else (self,):
+            registry._state.clear()
+            registry._registry_names.clear()
+            registry._name_index.clear()
+            registry._resolve_cache.clear()
 
     def clear_filters(self, nested: bool = False) -> None:
         r"""Clear all the filters of the registry.
@@ -156,11 +190,8 @@ class Registry:
 
         ```
         """
-        if nested:  # If True, clear all the sub-registries.
-            for value in self._state.values():
-                if isinstance(value, Registry):
-                    value.clear_filters(nested)
-        self._filters.clear()
+        for registry in self._iter_registries() if nested else (self,):
+            registry._filters.clear()
 
     def factory(self, _target_: str, *args: Any, _init_: str = "__init__", **kwargs: Any) -> Any:
         r"""Instantiate dynamically an object given its configuration.
@@ -270,10 +301,11 @@ class Registry:
 
         ```
         """
-        for class_to_register in [cls] + list(all_child_classes(cls)):
-            if ignore_abstract_class and inspect.isabstract(class_to_register):
+        register_object = self.register_object
+        for class_to_register in chain((cls,), all_child_classes(cls)):
+            if ignore_abstract_class and _is_abstract(class_to_register):
                 continue
-            self.register_object(class_to_register)
+            register_object(class_to_register)
 
     def register_object(self, obj: type | Callable, name: str | None = None) -> None:
         r"""Register an object.
@@ -320,10 +352,17 @@ class Registry:
                 raise InvalidNameFactoryError(msg)
             if self._state[name] != obj:
                 logger.warning(
-                    f"The name `{name}` already exists and its value will be replaced by {obj}"
+                    "The name `%s` already exists and its value will be replaced by %s", name, obj
                 )
 
         self._state[name] = obj
+        if isinstance(obj, Registry):
+            self._registry_names.add(name)
+            self._name_index.get(_short_name(name), set()).discard(name)
+        else:
+            self._registry_names.discard(name)
+            self._name_index.setdefault(_short_name(name), set()).add(name)
+        self._resolve_cache.clear()
 
     def registered_names(self, include_registry: bool = True) -> set[str]:
         r"""Get the names of all the registered objects.
@@ -349,12 +388,7 @@ class Registry:
         """
         if include_registry:
             return set(self._state.keys())
-
-        names = set()
-        for key, value in self._state.items():
-            if not isinstance(value, Registry):
-                names.add(key)
-        return names
+        return self._state.keys() - self._registry_names
 
     def unregister(self, name: str) -> None:
         r"""Remove a registered object.
@@ -380,12 +414,14 @@ class Registry:
         ```
         """
         resolved_name = self._resolve_name(name)
-        if resolved_name is None or not self._is_name_registered(resolved_name):
+        if resolved_name is None or self._state.pop(resolved_name, _MISSING) is _MISSING:
             msg = (
                 f"It is not possible to remove an object which is not registered (received: {name})"
             )
             raise UnregisteredObjectFactoryError(msg)
-        self._state.pop(resolved_name)
+        self._registry_names.discard(resolved_name)
+        self._name_index.get(_short_name(resolved_name), set()).discard(resolved_name)
+        self._resolve_cache.clear()
 
     def set_class_filter(self, cls: type | None) -> None:
         r"""Set the class filter so only the child classes of this class
@@ -418,7 +454,7 @@ class Registry:
             self._filters.pop(self._CLASS_FILTER, None)
             return
 
-        if not inspect.isclass(cls):
+        if not isinstance(cls, type):
             msg = f"The class filter has to be a class (received: {cls})"
             raise TypeError(msg)
         self._filters[self._CLASS_FILTER] = cls
@@ -437,7 +473,7 @@ class Registry:
             IncorrectObjectFactoryError: if it is an invalid
                 object for this factory.
         """
-        if is_lambda_function(obj):
+        if isinstance(obj, FunctionType) and is_lambda_function(obj):
             msg = (
                 "It is not possible to register a lambda function. "
                 "Please use a regular function instead"
@@ -450,6 +486,29 @@ class Registry:
             msg = f"All the registered objects should inherit {class_name} class (received {obj})"
             raise IncorrectObjectFactoryError(msg)
 
+    def _iter_registries(self) -> Iterator[Registry]:
+        r"""Iterate over the registry and all its sub-registries.
+
+        The sub-registries are found with an explicit stack, so the
+        depth of the registry tree is not limited by the recursion
+        limit. The sub-registries of a registry are collected before
+        the registry is returned, so it is safe to clear it. Each
+        registry is returned once, even if it is registered several
+        times or contains itself.
+
+        Yields:
+            The registry and all its sub-registries.
+        """
+        stack = [self]
+        visited = set()
+        while stack:
+            registry = stack.pop()
+            if id(registry) in visited:
+                continue
+            visited.add(id(registry))
+            stack.extend(registry._state[name] for name in registry._registry_names)
+            yield registry
+
     def _get_target_from_name(self, name: str) -> Any:
         r"""Get the class or function to used given its name.
 
@@ -463,11 +522,14 @@ class Registry:
             UnregisteredObjectFactoryError: if it is not possible
                 to find the target.
         """
+        target = self._state.get(name)
+        if target is not None and name not in self._registry_names:
+            return target
         resolved_name = self._resolve_name(name)
         if resolved_name is None:
             msg = (
                 f"Unable to create the object `{name}` because it is not registered. "
-                f"Registered objects of {self.__name__} are "
+                f"Registered objects of {type(self).__qualname__} are "
                 f"{self.registered_names(include_registry=False)}."
             )
             raise UnregisteredObjectFactoryError(msg)
@@ -496,7 +558,7 @@ class Registry:
             ``True`` if the name is used as sub-registry,
                 otherwise ``False``.
         """
-        return isinstance(self._state[name], Registry)
+        return name in self._registry_names
 
     def _resolve_name(self, name: str) -> str | None:
         r"""Try to resolve the name.
@@ -507,6 +569,8 @@ class Registry:
         registered. If you specify a full name (module path +
         class/function name), it will try to import the module
         and registered it if it is not registered yet.
+        The successful resolutions are cached until the next change
+        of the registered objects.
 
         Args:
             name: Specifies the name to resolve.
@@ -516,4 +580,15 @@ class Registry:
                 object if the resolution was successful,
                 otherwise ``None``.
         """
-        return resolve_name(name, self.registered_names(include_registry=False))
+        if (resolved_name := self._resolve_cache.get(name)) is not None:
+            return resolved_name
+        # The short name index gives the candidates in one lookup. Like
+        # find_matches, only a valid identifier can be a short name.
+        matches = self._name_index.get(name, ())
+        if len(matches) == 1 and name not in self._state and name.isidentifier():
+            resolved_name = next(iter(matches))
+        else:
+            resolved_name = resolve_name(name, self.registered_names(include_registry=False))
+        if resolved_name is not None:
+            self._resolve_cache[name] = resolved_name
+        return resolved_name
@@ -5,10 +5,12 @@ from __future__ import annotations
 
 __all__ = ["is_object_config"]
 
-import inspect
 import sys
+from types import FunctionType
+from typing import Any
 from typing import _UnionGenericAlias as UnionGenericAlias
 from typing import get_type_hints
+from weakref import WeakKeyDictionary
 
 if sys.version_info >= (3, 10):
     from types import UnionType
@@ -18,6 +20,10 @@ else:  # pragma: no cover
 from objectory.constants import OBJECT_TARGET
 from objectory.utils.object_helpers import import_object
 
+# Cache of the return type hints of the functions. The keys are weak
+# references, so the cache does not keep the functions alive.
+_RETURN_TYPE_HINT_CACHE: WeakKeyDictionary[Any, Any] = WeakKeyDictionary()
+
 
 def is_object_config(config: dict, cls: type) -> bool:
     r"""Indicate if the input configuration is a configuration for a
@@ -50,10 +56,31 @@ def is_object_config(config: dict, cls: type) -> bool:
     if target is None:
         return False
     target = import_object(target)
-    if inspect.isfunction(target):
-        target = get_type_hints(target).get("return")
+    if isinstance(target, FunctionType):
+        target = _get_return_type_hint(target)
     if target is None:
         return False
     # Union and | -> (UnionGenericAlias, UnionType)
-    targets = target.__args__ if isinstance(target, (UnionGenericAlias, UnionType)) else [target]
-    return any(cls in target.__mro__ for target in targets)
+    if isinstance(target, (UnionGenericAlias, UnionType)):
+        return any(cls in arg.__mro__ for arg in target.__args__)
+    return cls in target.__mro__
+
+
+def _get_return_type_hint(func: Any) -> Any:
+    r"""Get the return type hint of a function.
+
+    The type hints are resolved once per function and then cached
+    because ``get_type_hints`` is slow.
+
+    Args:
+        func: Specifies the function.
+
+    Returns:
+        The return type hint or ``None`` if the function does not
+            have a return type hint.
+    """
+    try:
+        return _RETURN_TYPE_HINT_CACHE[func]
+    except KeyError:
+        hint = _RETURN_TYPE_HINT_CACHE[func] = get_type_hints(func).get("return")
+        return hint
@@ -8,11 +8,15 @@ from __future__ import annotations
 
 __all__ = ["resolve_name", "find_matches"]
 
+from typing import TYPE_CHECKING
 
 from objectory.utils.object_helpers import full_object_name, import_object
 
+if TYPE_CHECKING:
+    from collections.abc import Collection
 
-def resolve_name(name: str, object_names: set[str], allow_import: bool = True) -> str | None:
+
+def resolve_name(name: str, object_names: Collection[str], allow_import: bool = True) -> str | None:
     r"""Find a match of the query name in the set of object names.
 
     The resolution is successful only if there is only one object
@@ -23,7 +27,9 @@ def resolve_name(name: str, object_names: set[str], allow_import: bool = True) -
     Args:
         name: Specifies the query name to use to find a match
             in the set of object names.
-        object_names: Specifies the set of object names.
+        object_names: Specifies the set of object names. Any
+            collection with a fast membership test (e.g. a set or
+            the keys of a dictionary) can be used.
         allow_import: If ``True``, the parent package
             is installed if it was not imported previously.
 
@@ -48,7 +54,7 @@ def resolve_name(name: str, object_names: set[str], allow_import: bool = True) -
         return name
 
     if len(matches := find_matches(name, object_names)) == 1:
-        return list(matches)[0]
+        return next(iter(matches))
 
     if (obj := import_object(name)) is not None:
         object_name = full_object_name(obj)
@@ -57,7 +63,7 @@ def resolve_name(name: str, object_names: set[str], allow_import: bool = True) -
     return None
 
 
-def find_matches(query: str, object_names: set[str]) -> set[str]:
+def find_matches(query: str, object_names: Collection[str]) -> set[str]:
     r"""Find the set of potential names that ends with the given query.
 
     This function is used when the user only specify a valid object
@@ -69,7 +75,8 @@ def find_matches(query: str, object_names: set[str]) -> set[str]:
     Args:
         query: Specifies the query.
         object_names: Specifies the set of object names where
-            to look for the query.
+            to look for the query. Any collection of names (e.g. a
+            set or the keys of a dictionary) can be used.
 
     Returns:
         The list of names that matches with the query.
@@ -94,9 +101,16 @@ def find_matches(query: str, object_names: set[str]) -> set[str]:
     if not query.isidentifier():
         return set()
 
-    matches = set()
-    for name in object_names:
-        obj_name = name.rsplit(sep=".", maxsplit=1)[-1]
-        if obj_name == query:
-            matches.add(name)
-    return matches
+    return {name for name in object_names if _short_name(name) == query}
+
+
+def _short_name(name: str) -> str:
+    r"""Get the short name of an object given its full name.
+
+    Args:
+        name: Specifies the full name of the object.
+
+    Returns:
+        The short name i.e. the last part of the full name.
+    """
+    return name.rpartition(".")[2]
@@ -10,16 +10,34 @@ __all__ = [
     "is_lambda_function",
 ]
 
-import inspect
+import contextlib
+import importlib
 import logging
-from typing import Any, Callable
-
-from tornado.util import import_object as tornado_import_object
+import sys
+from types import FunctionType
+from typing import TYPE_CHECKING, Any, Callable
+from weakref import WeakKeyDictionary
 
 from objectory.errors import AbstractClassFactoryError, IncorrectObjectFactoryError
 
+if TYPE_CHECKING:
+    from types import ModuleType
+
 logger = logging.getLogger(__name__)
 
+# Flag set by Python on the classes with abstract methods. It is the
+# flag checked by ``inspect.isabstract``, so ``inspect`` (slow to
+# import) is not needed to detect the abstract classes.
+_TPFLAGS_IS_ABSTRACT = 1 << 20
+
+# Sentinel used to detect a missing attribute or key in a single lookup.
+_MISSING = object()
+
+# Cache of the full names of the classes/functions. The keys are weak
+# references so the cache does not keep alive the dynamically created
+# classes or functions.
+_FULL_NAME_CACHE: WeakKeyDictionary[Any, str] = WeakKeyDictionary()
+
 
 def all_child_classes(cls: type) -> set[type]:
     r"""Get all the child classes (or subclasses) of a given class.
@@ -49,9 +67,16 @@ def all_child_classes(cls: type) -> set[type]:
 
     ```
     """
-    return set(cls.__subclasses__()).union(
-        [s for c in cls.__subclasses__() for s in all_child_classes(c)]
-    )
+    child_classes = set()
+    stack = [cls]
+    while stack:
+        for child_class in stack.pop().__subclasses__():
+            # A class can be reached several times with multiple
+            # inheritance, but its child classes are visited once.
+            if child_class not in child_classes:
+                child_classes.add(child_class)
+                stack.append(child_class)
+    return child_classes
 
 
 def full_object_name(obj: Any) -> str:
@@ -86,13 +111,23 @@ def full_object_name(obj: Any) -> str:
 
     ```
     """
-    if inspect.isclass(obj) or inspect.isfunction(obj):
-        return _full_object_name(obj)
-    msg = f"Incorrect object type: {obj}"
-    raise TypeError(msg)
+    try:
+        # Only classes and functions are added to the cache, so the
+        # type check can be skipped for the objects in the cache.
+        return _FULL_NAME_CACHE[obj]
+    except (KeyError, TypeError):
+        pass
+    if not isinstance(obj, (type, FunctionType)):
+        msg = f"Incorrect object type: {obj}"
+        raise TypeError(msg)
+    name = _compute_full_object_name(obj)
+    # The object is not cached if it cannot be hashed or weakly referenced.
+    with contextlib.suppress(TypeError):
+        _FULL_NAME_CACHE[obj] = name
+    return name
 
 
-def _full_object_name(obj: object | type) -> str:
+def _compute_full_object_name(obj: object | type) -> str:
     r"""Compute the full class name of a class/function.
 
     Based on: https://gist.github.com/clbarnes/edd28ea32010eb159b34b075687bb49e
@@ -107,7 +142,9 @@ def _full_object_name(obj: object | type) -> str:
     name = obj.__qualname__
     if (module := obj.__module__) is not None and module != "__builtin__":
         name = module + "." + name
-    return name
+    # The name is used as key in the factories, so all the factories
+    # share the same string object.
+    return sys.intern(name)
 
 
 def import_object(object_path: str) -> Any:
@@ -141,11 +178,70 @@ def import_object(object_path: str) -> Any:
         msg = f"`object_path` has to be a string (received: {object_path})"
         raise TypeError(msg)
     try:
-        return tornado_import_object(object_path)
+        return _import_object(object_path)
     except (ValueError, ImportError):
         return None
 
 
+def _import_object(object_path: str) -> Any:
+    r"""Import an object given its path.
+
+    The attribute is read at every call, so the changes of the module
+    attributes (e.g. ``unittest.mock.patch`` or
+    ``importlib.reload``) are visible. Only the module lookup uses
+    the ``sys.modules`` fast path.
+
+    Args:
+        object_path: Specifies the path of the object to import.
+
+    Returns:
+        The imported object.
+
+    Raises:
+        ImportError: if the object cannot be imported.
+        ValueError: if the object path is not valid.
+    """
+    if object_path.startswith("."):
+        msg = f"Relative object paths are not supported (received: {object_path})"
+        raise ValueError(msg)
+    if "." not in object_path:
+        # The path of a top-level module e.g. ``"collections"``.
+        return _import_module(object_path)
+
+    module_path, _, name = object_path.rpartition(".")
+    module = _import_module(module_path)
+    try:
+        return getattr(module, name)
+    except AttributeError:
+        pass
+    # The object can be a submodule which is not imported yet.
+    try:
+        return importlib.import_module(object_path)
+    except ImportError as exc:
+        msg = f"No module named {name}"
+        raise ImportError(msg) from exc
+
+
+def _import_module(module_path: str) -> ModuleType:
+    r"""Import a module given its path.
+
+    The module is looked up in ``sys.modules`` first, so the import
+    machinery is used only if the module was not imported before.
+
+    Args:
+        module_path: Specifies the absolute path of the module.
+
+    Returns:
+        The module.
+
+    Raises:
+        ImportError: if the module cannot be imported.
+    """
+    if (module := sys.modules.get(module_path)) is None:
+        module = importlib.import_module(module_path)
+    return module
+
+
 def instantiate_object(
     obj: Callable | type, *args: Any, _init_: str = "__init__", **kwargs: Any
 ) -> Any:
@@ -180,14 +276,28 @@ def instantiate_object(
 
     ```
     """
-    if inspect.isfunction(obj):
+    if isinstance(obj, FunctionType):
         return obj(*args, **kwargs)
-    if inspect.isclass(obj):
+    if isinstance(obj, type):
         return _instantiate_class_object(obj, *args, _init_=_init_, **kwargs)
     msg = f"Incorrect type: {obj}. The valid types are class and function"
     raise TypeError(msg)
 
 
+def _is_abstract(cls: type) -> bool:
+    r"""Indicate if a class is abstract.
+
+    It gives the same result as ``inspect.isabstract`` for classes.
+
+    Args:
+        cls: Specifies the class to check.
+
+    Returns:
+        ``True`` if the class is abstract, otherwise ``False``.
+    """
+    return bool(cls.__flags__ & _TPFLAGS_IS_ABSTRACT)
+
+
 def _instantiate_class_object(
     cls: type, *args: Any, _init_: str = "__init__", **kwargs: Any
 ) -> Any:
@@ -212,17 +322,16 @@ def _instantiate_class_object(
         IncorrectObjectFactoryError: if it is not possible to
             instantiate the object.
     """
-    if inspect.isabstract(cls):
+    if _is_abstract(cls):
         msg = f"Cannot instantiate the class {cls} because it is an abstract class."
         raise AbstractClassFactoryError(msg)
 
     if _init_ == "__init__":
         return cls(*args, **kwargs)
 
-    if not hasattr(cls, _init_):
+    if (init_fn := getattr(cls, _init_, _MISSING)) is _MISSING:
         msg = f"{cls} does not have `{_init_}` attribute"
         raise IncorrectObjectFactoryError(msg)
-    init_fn = getattr(cls, _init_)
     if not callable(init_fn):
         msg = f"`{_init_}` attribute of {cls} is not callable"
         raise IncorrectObjectFactoryError(msg)
@@ -259,6 +368,4 @@ def is_lambda_function(obj: Any) -> bool:
 
     ```
     """
-    if not inspect.isfunction(obj):
-        return False
-    return obj.__name__ == "<lambda>"
+    return isinstance(obj, FunctionType) and obj.__name__ == "<lambda>"
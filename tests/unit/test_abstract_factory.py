@@ -235,6 +235,58 @@ def test_factory_duplicate_class_name() -> None:
         BaseClass.factory("Counter")
 
 
+def test_factory_short_name_after_unregister() -> None:
+    Class1.unregister("Class3")
+    with pytest.raises(
+        UnregisteredObjectFactoryError,
+        match="Unable to create the object `Class3` because it is not registered.",
+    ):
+        Class1.factory("Class3")
+
+
+def test_factory_short_name_inheritors_cleared() -> None:
+    Class1.inheritors.clear()
+    with pytest.raises(
+        UnregisteredObjectFactoryError,
+        match="Unable to create the object `Class2` because it is not registered.",
+    ):
+        Class1.factory("Class2")
+
+
+def test_factory_short_name_inheritors_updated() -> None:
+    Class1.inheritors["tests.unit.test_abstract_factory.ClassToRegister"] = ClassToRegister
+    assert isinstance(Class1.factory("ClassToRegister"), ClassToRegister)
+
+
+def test_factory_short_name_inheritors_updated_ambiguous() -> None:
+    class Base(metaclass=AbstractFactory):
+        pass
+
+    class OrderedDict(Base):
+        pass
+
+    Base.inheritors["collections.OrderedDict"] = collections.OrderedDict
+    with pytest.raises(
+        UnregisteredObjectFactoryError,
+        match="Unable to create the object `OrderedDict` because it is not registered.",
+    ):
+        # Should fail because the class name OrderedDict is not unique.
+        Base.factory("OrderedDict")
+
+
+def test_factory_short_name_not_identifier() -> None:
+    def my_func() -> int:
+        return 42
+
+    my_func.__qualname__ = "weird.my-func"
+    Class1.register_object(my_func)
+    with pytest.raises(
+        UnregisteredObjectFactoryError,
+        match="Unable to create the object `my-func` because it is not registered.",
+    ):
+        Class1.factory("my-func")
+
+
 def test_factory_unregistered_class() -> None:
     obj = Class1.factory("collections.Counter")
     assert isinstance(obj, collections.Counter)
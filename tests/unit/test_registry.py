@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import copy
+import logging
+import pickle
+import sys
+import weakref
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 from typing import TYPE_CHECKING, TypeVar
@@ -121,6 +126,18 @@ def test_register_object_replace_object() -> None:
     assert registry._state == {"name": function_to_register}
 
 
+def test_register_object_replace_object_warning(caplog: pytest.LogCaptureFixture) -> None:
+    registry = Registry()
+    with caplog.at_level(level=logging.WARNING):
+        registry.register_object(ClassToRegister, name="name")
+        assert caplog.messages == []
+        registry.register_object(function_to_register, name="name")
+        assert len(caplog.messages) == 1
+        assert caplog.messages[0].startswith(
+            "The name `name` already exists and its value will be replaced by <function"
+        )
+
+
 def test_register_object_replace_subregistry() -> None:
     registry = Registry()
     registry.other.register_object(ClassToRegister)
@@ -131,6 +148,26 @@ def test_register_object_replace_subregistry() -> None:
         registry.register_object(function_to_register, name="other")
 
 
+def test_register_object_name_of_cleared_subregistry() -> None:
+    registry = Registry()
+    registry.other.register_object(ClassToRegister)
+    registry.clear()
+    registry.register_object(ClassToRegister, name="other")
+    assert registry._state == {"other": ClassToRegister}
+    assert registry.registered_names(include_registry=False) == {"other"}
+
+
+def test_register_object_registry() -> None:
+    registry = Registry()
+    sub_registry = Registry()
+    sub_registry.register_object(ClassToRegister)
+    registry.register_object(sub_registry, name="other")
+    assert registry.other is sub_registry
+    assert registry.registered_names(include_registry=False) == set()
+    registry.clear(nested=True)
+    assert sub_registry._state == {}
+
+
 def test_register_object_duplicate() -> None:
     registry = Registry()
     registry.register_object(ClassToRegister, name="name")
@@ -260,6 +297,46 @@ def test_get_attribute_already_exist() -> None:
     }
 
 
+def test_get_attribute_special_attribute() -> None:
+    registry = Registry()
+    with pytest.raises(AttributeError, match="'Registry' object has no attribute '__missing__'"):
+        registry.__missing__  # noqa: B018
+    assert registry._state == {}
+
+
+def test_deepcopy() -> None:
+    registry = Registry()
+    registry.register_object(ClassToRegister)
+    registry.other.register_object(OrderedDict)
+    registry_copy = copy.deepcopy(registry)
+    assert registry_copy._state.keys() == registry._state.keys()
+    assert registry_copy.other.registered_names() == {"collections.OrderedDict"}
+
+
+def test_pickle() -> None:
+    registry = Registry()
+    registry.register_object(ClassToRegister)
+    registry.other.register_object(OrderedDict)
+    registry_copy = pickle.loads(pickle.dumps(registry))  # noqa: S301
+    assert registry_copy._state.keys() == registry._state.keys()
+    assert registry_copy.other.registered_names() == {"collections.OrderedDict"}
+
+
+def test_get_attribute_uninitialized_slot() -> None:
+    registry = Registry.__new__(Registry)
+    with pytest.raises(AttributeError, match="'Registry' object has no attribute '_state'"):
+        registry._state  # noqa: B018
+
+
+def test_no_instance_dict() -> None:
+    assert not hasattr(Registry(), "__dict__")
+
+
+def test_weakref() -> None:
+    registry = Registry()
+    assert weakref.ref(registry)() is registry
+
+
 def test_get_attribute_invalid_subregistry() -> None:
     registry = Registry()
     registry.register_object(ClassToRegister, name="other")
@@ -424,6 +501,70 @@ def test_factory_duplicate_class_name() -> None:
         registry.factory("OrderedDict")
 
 
+def test_factory_short_name_after_duplicate_registration() -> None:
+    registry = Registry()
+    registry.register_object(OrderedDict)
+    assert isinstance(registry.factory("OrderedDict"), OrderedDict)
+    registry.register_object(OrderedDict, name="my_package.OrderedDict")
+    with pytest.raises(
+        UnregisteredObjectFactoryError,
+        match="Unable to create the object `OrderedDict` because it is not registered.",
+    ):
+        # Should fail because the object name is not unique anymore.
+        registry.factory("OrderedDict")
+
+
+def test_factory_short_name_custom_name() -> None:
+    registry = Registry()
+    registry.register_object(ClassToRegister, name="my_package.MyClass")
+    assert isinstance(registry.factory("MyClass", arg1=6), ClassToRegister)
+
+
+def test_factory_short_name_not_identifier() -> None:
+    registry = Registry()
+    registry.register_object(ClassToRegister, name="my_package.my-class")
+    with pytest.raises(
+        UnregisteredObjectFactoryError,
+        match="Unable to create the object `my-class` because it is not registered.",
+    ):
+        registry.factory("my-class", arg1=6)
+
+
+def test_factory_short_name_after_unregister() -> None:
+    registry = Registry()
+    registry.register_object(ClassToRegister)
+    assert isinstance(registry.factory("ClassToRegister", arg1=6), ClassToRegister)
+    registry.unregister("ClassToRegister")
+    with pytest.raises(
+        UnregisteredObjectFactoryError,
+        match="Unable to create the object `ClassToRegister` because it is not registered.",
+    ):
+        registry.factory("ClassToRegister", arg1=6)
+
+
+def test_factory_short_name_after_clear() -> None:
+    registry = Registry()
+    registry.register_object(ClassToRegister)
+    assert isinstance(registry.factory("ClassToRegister", arg1=6), ClassToRegister)
+    registry.clear()
+    with pytest.raises(
+        UnregisteredObjectFactoryError,
+        match="Unable to create the object `ClassToRegister` because it is not registered.",
+    ):
+        registry.factory("ClassToRegister", arg1=6)
+
+
+def test_factory_subregistry_name() -> None:
+    registry = Registry()
+    registry.other.register_object(ClassToRegister)
+    with pytest.raises(
+        UnregisteredObjectFactoryError,
+        match="Unable to create the object `other` because it is not registered.",
+    ):
+        # Should fail because the name is used by a sub-registry.
+        registry.factory("other")
+
+
 def test_factory_unregistered_incorrect_class_name() -> None:
     registry = Registry()
     with pytest.raises(
@@ -495,6 +636,35 @@ def test_clear_nested_true() -> None:
     assert registry_other2._state == {}
 
 
+def test_clear_nested_true_deep() -> None:
+    registry = leaf = Registry()
+    for _ in range(sys.getrecursionlimit() + 10):
+        leaf = leaf.other
+    leaf.register_object(ClassToRegister)
+    registry.clear(nested=True)
+    assert registry._state == {}
+    assert leaf._state == {}
+
+
+def test_clear_nested_true_cycle() -> None:
+    registry = Registry()
+    registry.register_object(ClassToRegister)
+    registry.register_object(registry, name="self")
+    registry.clear(nested=True)
+    assert registry._state == {}
+
+
+def test_clear_nested_true_shared_subregistry() -> None:
+    registry = Registry()
+    shared = Registry()
+    shared.register_object(ClassToRegister)
+    registry.register_object(shared, name="first")
+    registry.register_object(shared, name="second")
+    assert len(list(registry._iter_registries())) == 2
+    registry.clear(nested=True)
+    assert shared._state == {}
+
+
 def test_unregister_exact_name() -> None:
     registry = Registry()
     registry.register_object(ClassToRegister)
@@ -605,6 +775,23 @@ def test_clear_filters_nested_true() -> None:
     assert len(registry_other2._filters) == 0
 
 
+def test_clear_filters_nested_true_deep() -> None:
+    registry = leaf = Registry()
+    for _ in range(sys.getrecursionlimit() + 10):
+        leaf = leaf.other
+    leaf.set_class_filter(ClassToRegister)
+    registry.clear_filters(nested=True)
+    assert leaf._filters == {}
+
+
+def test_clear_filters_nested_true_cycle() -> None:
+    registry = Registry()
+    registry.register_object(registry, name="self")
+    registry.set_class_filter(ClassToRegister)
+    registry.clear_filters(nested=True)
+    assert registry._filters == {}
+
+
 #################
 #     other     #
 #################
@@ -1,11 +1,13 @@
 import sys
 from collections import Counter
+from collections.abc import Mapping
 from typing import Union
 
 import pytest
 
 from objectory import OBJECT_TARGET
 from objectory.utils import is_object_config
+from objectory.utils.config import _RETURN_TYPE_HINT_CACHE
 
 py310_plus = pytest.mark.skipif(sys.version_info < (3, 10), reason="Requires python 3.10+")
 
@@ -71,7 +73,24 @@ def test_is_object_config_false_incorrect_class() -> None:
     assert not is_object_config({OBJECT_TARGET: "builtins.int"}, float)
 
 
+def test_is_object_config_false_virtual_subclass() -> None:
+    # dict is only a virtual subclass of Mapping, it is not in its MRO.
+    assert not is_object_config({OBJECT_TARGET: "builtins.dict"}, Mapping)
+
+
 def test_is_object_config_false_function_without_type_hint() -> None:
     assert not is_object_config(
         {OBJECT_TARGET: "tests.unit.utils.test_config.create_list_without_type_hint"}, float
     )
+
+
+def test_is_object_config_return_type_hint_cached() -> None:
+    assert is_object_config({OBJECT_TARGET: "tests.unit.utils.test_config.create_list"}, list)
+    assert _RETURN_TYPE_HINT_CACHE[create_list] is list
+
+
+def test_is_object_config_missing_return_type_hint_cached() -> None:
+    assert not is_object_config(
+        {OBJECT_TARGET: "tests.unit.utils.test_config.create_list_without_type_hint"}, list
+    )
+    assert _RETURN_TYPE_HINT_CACHE[create_list_without_type_hint] is None
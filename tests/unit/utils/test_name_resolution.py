@@ -43,6 +43,16 @@ def test_resolve_name_imported_name() -> None:
     )
 
 
+def test_resolve_name_dict_keys() -> None:
+    assert (
+        resolve_name(
+            "OrderedDict",
+            {"collections.OrderedDict": 1, "collections.Counter": 2, "math.isclose": 3}.keys(),
+        )
+        == "collections.OrderedDict"
+    )
+
+
 def test_resolve_name_allow_import_false_exist() -> None:
     assert (
         resolve_name("OrderedDict", {"collections.OrderedDict"}, allow_import=False)
@@ -81,6 +91,13 @@ def test_find_matches_2_matches() -> None:
     ) == {"collections.OrderedDict", "typing.OrderedDict"}
 
 
+def test_find_matches_dict_keys() -> None:
+    assert find_matches(
+        "OrderedDict",
+        {"collections.OrderedDict": 1, "typing.OrderedDict": 2, "math.isclose": 3}.keys(),
+    ) == {"collections.OrderedDict", "typing.OrderedDict"}
+
+
 def test_find_matches_invalid_query() -> None:
     assert (
         find_matches(
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import collections.abc
+import gc
+import sys
+import weakref
 from abc import ABC, abstractmethod
 from collections import Counter
 from math import isclose
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -16,6 +20,7 @@ from objectory.utils import (
     instantiate_object,
     is_lambda_function,
 )
+from objectory.utils.object_helpers import _FULL_NAME_CACHE, _is_abstract
 
 
 class FakeClass:
@@ -69,6 +74,27 @@ def test_all_child_classes() -> None:
     assert all_child_classes(Foo) == {Bar, Baz, Bing}
 
 
+def test_all_child_classes_multiple_inheritance() -> None:
+    class Foo: ...
+
+    class Bar(Foo): ...
+
+    class Baz(Foo): ...
+
+    class Bing(Bar, Baz): ...
+
+    class Bong(Bing): ...
+
+    assert all_child_classes(Foo) == {Bar, Baz, Bing, Bong}
+
+
+def test_all_child_classes_deep() -> None:
+    classes = [type("Class0", (), {})]
+    for i in range(1, sys.getrecursionlimit() + 10):
+        classes.append(type(f"Class{i}", (classes[-1],), {}))
+    assert all_child_classes(classes[0]) == set(classes[1:])
+
+
 ############################
 #     full_object_name     #
 ############################
@@ -101,11 +127,49 @@ def test_full_object_name_builtin_module() -> None:
     )
 
 
+def test_full_object_name_interned() -> None:
+    name = full_object_name(FakeClass)
+    assert name is sys.intern("tests.unit.utils.test_object_helpers." + "FakeClass")
+
+
+def test_full_object_name_cache_does_not_keep_object_alive() -> None:
+    class FakeClass: ...
+
+    assert full_object_name(FakeClass).endswith("<locals>.FakeClass")
+    ref = weakref.ref(FakeClass)
+    del FakeClass
+    gc.collect()
+    assert ref() is None
+
+
 def test_full_object_name_incorrect_type() -> None:
     with pytest.raises(TypeError, match="Incorrect object type:"):
         full_object_name(1)
 
 
+def test_full_object_name_incorrect_type_unhashable() -> None:
+    with pytest.raises(TypeError, match="Incorrect object type:"):
+        full_object_name([1, 2])
+
+
+def test_full_object_name_cached() -> None:
+    full_object_name(FakeClass)
+    assert _FULL_NAME_CACHE[FakeClass] == "tests.unit.utils.test_object_helpers.FakeClass"
+
+
+def test_full_object_name_unhashable_class() -> None:
+    class UnhashableMeta(type):
+        __hash__ = None
+
+    class UnhashableClass(metaclass=UnhashableMeta):
+        pass
+
+    assert full_object_name(UnhashableClass) == (
+        "tests.unit.utils.test_object_helpers."
+        "test_full_object_name_unhashable_class.<locals>.UnhashableClass"
+    )
+
+
 #########################
 #     import_object     #
 #########################
@@ -119,10 +183,33 @@ def test_import_object_function() -> None:
     assert import_object("math.isclose") == isclose
 
 
+def test_import_object_module() -> None:
+    assert import_object("collections") is collections
+
+
+def test_import_object_submodule() -> None:
+    assert import_object("collections.abc") is collections.abc
+
+
 def test_import_object_incorrect() -> None:
     assert import_object("collections.NotACounter") is None
 
 
+@pytest.mark.parametrize(
+    "object_path",
+    ["", ".", "collections.", ".collections.Counter", "..Counter", "missing_module.Counter"],
+)
+def test_import_object_invalid_path(object_path: str) -> None:
+    assert import_object(object_path) is None
+
+
+def test_import_object_patched() -> None:
+    assert import_object("collections.Counter") is Counter
+    with patch("collections.Counter") as mock:
+        assert import_object("collections.Counter") is mock
+    assert import_object("collections.Counter") is Counter
+
+
 def test_import_object_incorrect_type() -> None:
     with pytest.raises(TypeError, match="`object_path` has to be a string"):
         import_object(1)
@@ -206,12 +293,16 @@ def test_instantiate_object_init_regular_method() -> None:
 
 
 def test_instantiate_object_init_not_method() -> None:
-    FakeClass.not_a_method = None
+    # Use a local child class to not modify FakeClass for the other tests.
+    class FakeChildClass(FakeClass):
+        not_a_method = None
+
     with pytest.raises(
         IncorrectObjectFactoryError, match="`not_a_method` attribute of .* is not callable"
     ):
         # Should fail because the attribute not_a_method is not a method.
-        instantiate_object(FakeClass, _init_="not_a_method")
+        instantiate_object(FakeChildClass, _init_="not_a_method")
+    assert not hasattr(FakeClass, "not_a_method")
 
 
 def test_instantiate_object_abstract_class() -> None:
@@ -266,6 +357,25 @@ def test_instantiate_object_incorrect_type() -> None:
         instantiate_object(FakeClass(12))
 
 
+##################################
+#     Tests for _is_abstract     #
+##################################
+
+
+def test_is_abstract_true() -> None:
+    class FakeAbstractClass(ABC):
+        @abstractmethod
+        def my_method(self) -> None:
+            """Abstract method."""
+
+    assert _is_abstract(FakeAbstractClass)
+
+
+@pytest.mark.parametrize("cls", [FakeClass, Counter, ABC, object])
+def test_is_abstract_false(cls: type) -> None:
+    assert not _is_abstract(cls)
+
+
 ########################################
 #     Tests for is_lambda_function     #
 ########################################